@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from rdflib import BNode, IdentifiedNode, URIRef
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 __all__ = (
     "get_key_or_attribute",
     "make_ref",
 )
 
+_MISSING = object()
+
 
 def make_ref(identifier: IdentifiedNode | str | None = None) -> IdentifiedNode:
     """Create a Node reference
@@ -31,32 +37,63 @@ def make_ref(identifier: IdentifiedNode | str | None = None) -> IdentifiedNode:
     if isinstance(identifier, IdentifiedNode):
         return identifier
     if isinstance(identifier, str):
-        if identifier.startswith("_:"):
-            return BNode(identifier[2:])
-        return URIRef(identifier)
+        return _make_ref_str(identifier)
     raise TypeError(f"Invalid type: {type(identifier)}")
 
 
-def get_key_or_attribute(field: str, obj: Any, raise_error_if_missing: bool = False) -> Any:
+@lru_cache(maxsize=4096)
+def _make_ref_str(identifier: str) -> IdentifiedNode:
+    """Parse a string identifier into a `BNode` or `URIRef`
+
+    Results are cached since the same identifiers recur in bulk conversions. Both node types are immutable,
+    so the cached instances can be shared between callers.
+
+    Args:
+        identifier (str): identifier value. A `_:` prefix denotes a `BNode`
+
+    Returns:
+        IdentifiedNode: identifier as `IdentifiedNode` type
+    """
+    if identifier.startswith("_:"):
+        return BNode(identifier[2:])
+    return URIRef(identifier)
+
+
+def get_key_or_attribute(
+    field: str | Sequence[str],
+    obj: Any,
+    raise_error_if_missing: bool = False,
+    default: Any = None,
+) -> Any:
     """From an object, attempt to get key if object is dict like otherwise get attribute.
 
-    Read obj.get(field) then try getattr(obj, field)
+    Read getattr(obj, field) then try obj.get(field). If a sequence of names is provided, each name is
+    tried in order and the first match is returned, so that callers with alternative names do not need
+    to probe the object twice. At least one name must be provided.
 
     Args:
-        field (str): key/attribute name
+        field (str | Sequence[str]): key/attribute name or non-empty sequence of names to try in order
         obj (Any): object to extract key/attribute from
         raise_error_if_missing (bool, optional): whether to raise if the field is missing. Defaults to False.
+        default (Any, optional): value returned if the field is missing and `raise_error_if_missing`
+            is False. Defaults to None.
 
     Raises:
-        KeyError: If the object has no key or attribute with the name field
+        ValueError: If field is an empty sequence
+        KeyError: If the object has no key or attribute with the name field, or with any of the names in field
 
     Returns:
-        Any: the key/attribute value if they exist, or None if they don't and `raise_error_if_missing` is False
+        Any: the key/attribute value if they exist, or `default` if they don't and `raise_error_if_missing` is False
     """
-    if hasattr(obj, field):
-        return getattr(obj, field)
-    if isinstance(obj, dict) and field in obj:
-        return obj.get(field)
+    names = (field,) if isinstance(field, str) else field
+    if not names:
+        raise ValueError("At least one field name must be provided")
+    for name in names:
+        value = getattr(obj, name, _MISSING)
+        if value is not _MISSING:
+            return value
+        if isinstance(obj, dict) and name in obj:
+            return obj[name]
     if raise_error_if_missing:
-        raise KeyError(f"Object has no key: {field}")
-    return None
+        raise KeyError(f"Object has no key: {', '.join(names)}")
+    return default